@@ -8,25 +8,29 @@ import python from 'react-syntax-highlighter/dist/esm/languages/hljs/python';
 import solarizedDark from 'react-syntax-highlighter/dist/esm/styles/hljs/solarized-dark';
 
 SyntaxHighlighter.registerLanguage('python', python);
+
+const plugins = [
+  RemarkMathPlugin,
+  [gfm, {singleTilde: false}]
+];
+
+const renderers = {
+    math: ({ value }) => {
+        return <MathJax.Node formula={value} />
+    },
+    inlineMath: ({ value }) =>{
+        return <MathJax.Node inline formula={value} />
+    },
+    code: ({language, value}) => {
+      return <SyntaxHighlighter style={solarizedDark} language={language} children={value} showLineNumbers={true} />
+    }
+};
+
 function MarkdownRender(props) {
     const newProps = {
         ...props,
-        plugins: [
-          RemarkMathPlugin,
-          [gfm, {singleTilde: false}]
-        ],
-        renderers: {
-            ...props.renderers,
-            math: ({ value }) => {
-                return <MathJax.Node formula={value} />
-            },
-            inlineMath: ({ value }) =>{
-                return <MathJax.Node inline formula={value} />
-            },
-            code: ({language, value}) => {
-              return <SyntaxHighlighter style={solarizedDark} language={language} children={value} showLineNumbers={true} />
-            }
-        }
+        plugins,
+        renderers: props.renderers ? { ...props.renderers, ...renderers } : renderers
       };
       return (
         <MathJax.Provider>